@@ -46,6 +46,25 @@ def _get_largest_contour_bbox(image_rgb: np.ndarray) -> tuple[int, int, int, int
     return x, y, w, h
 
 
+def _load_log(path: Path) -> pd.DataFrame:
+    """Lê o CSV de logs de previsão, ordenado por timestamp."""
+    df = pd.read_csv(path, parse_dates=["timestamp"])
+    return df.sort_values("timestamp")
+
+
+def _filter_log(
+    df: pd.DataFrame, sources, tanks, start_date, end_date
+) -> pd.DataFrame:
+    """Aplica os filtros do dashboard (fonte, tanque e intervalo de datas)."""
+    mask = (
+        df["source"].isin(sources)
+        & df["tank_id"].isin(tanks)
+        & (df["timestamp"].dt.date >= start_date)
+        & (df["timestamp"].dt.date <= end_date)
+    )
+    return df[mask]
+
+
 def main():
     st.title("Predição de peso de peixes")
 
@@ -217,8 +236,7 @@ def main():
         st.subheader("Dashboard de previsões")
 
         if LOG_PATH.exists():
-            df = pd.read_csv(LOG_PATH, parse_dates=["timestamp"])
-            df = df.sort_values("timestamp")
+            df = _load_log(LOG_PATH)
 
             # Filtros
             sources = df["source"].unique().tolist()
@@ -239,13 +257,9 @@ def main():
             with col2:
                 end_date = st.date_input("Data final", value=max_date)
 
-            mask = (
-                df["source"].isin(selected_sources)
-                & df["tank_id"].isin(selected_tanks)
-                & (df["timestamp"].dt.date >= start_date)
-                & (df["timestamp"].dt.date <= end_date)
+            df_filt = _filter_log(
+                df, selected_sources, selected_tanks, start_date, end_date
             )
-            df_filt = df[mask]
 
             st.write("Últimas previsões filtradas:")
             st.dataframe(df_filt.tail(20))
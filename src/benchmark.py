@@ -0,0 +1,206 @@
+import argparse
+import contextlib
+import csv
+import importlib
+import multiprocessing as mp
+import os
+import resource
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import pandas as pd
+
+from src import synth_data
+
+REPORTS_DIR = Path(__file__).resolve().parents[1] / "reports"
+RESULTS_PATH = REPORTS_DIR / "benchmark.csv"
+SIZES = [10**4, 10**5, 10**6, 10**7, 10**8]
+RESULT_COLUMNS = ["rows", "stage", "status", "seconds", "peak_rss_mb", "rss_delta_mb"]
+
+
+def _stage_generate_fish(workdir: Path, n_rows: int, seed: int) -> None:
+    dists = synth_data.fit_species_distributions(pd.read_csv(synth_data.RAW_PATH))
+    synth_data.write_measurements(workdir / "raw" / "fish.csv", dists, n_rows, seed)
+
+
+def _stage_generate_log(workdir: Path, n_rows: int, seed: int) -> None:
+    dists = synth_data.fit_species_distributions(pd.read_csv(synth_data.RAW_PATH))
+    synth_data.write_prediction_log(
+        workdir / "log_predictions.csv", dists, n_rows, seed=seed
+    )
+
+
+def _stage_data_prep(workdir: Path, n_rows: int, seed: int) -> None:
+    from src import data_prep
+
+    data_prep.main(workdir / "raw" / "fish.csv", workdir / "processed")
+
+
+def _stage_train(workdir: Path, n_rows: int, seed: int) -> None:
+    import mlflow
+    from src import train
+
+    # não polui o mlruns/ do repositório
+    mlflow.set_tracking_uri((workdir / "mlruns").as_uri())
+    train.main(workdir / "processed" / "train.csv", workdir / "models")
+
+
+def _stage_drift(workdir: Path, n_rows: int, seed: int) -> None:
+    from src import data_drift_report
+
+    data_drift_report.main(
+        workdir / "processed" / "train.csv",
+        workdir / "processed" / "test.csv",
+        workdir / "reports",
+    )
+
+
+def _stage_dashboard(workdir: Path, n_rows: int, seed: int) -> None:
+    """Mesmo trabalho de pandas da aba Dashboard (sem renderizar os gráficos)."""
+    from app_streamlit import _filter_log, _load_log
+
+    df = _load_log(workdir / "log_predictions.csv")
+    df_filt = _filter_log(
+        df,
+        df["source"].unique().tolist(),
+        df["tank_id"].unique().tolist(),
+        df["timestamp"].min().date(),
+        df["timestamp"].max().date(),
+    )
+    df_filt.tail(20)
+    df_filt.set_index("timestamp")["biomass_kg"]
+
+
+# etapa -> (função, módulos importados antes de medir, etapa da qual depende)
+STAGES = {
+    "generate_fish": (_stage_generate_fish, [], None),
+    "generate_log": (_stage_generate_log, [], None),
+    "data_prep": (_stage_data_prep, ["src.data_prep"], "generate_fish"),
+    "train": (_stage_train, ["mlflow", "src.train"], "data_prep"),
+    "drift": (_stage_drift, ["src.data_drift_report"], "data_prep"),
+    "dashboard": (_stage_dashboard, ["app_streamlit"], "generate_log"),
+}
+
+
+def _max_rss_mb() -> float:
+    # ru_maxrss vem em KB no Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _run_stage(name: str, workdir: Path, n_rows: int, seed: int, queue) -> None:
+    """Executa uma etapa num processo próprio e devolve tempo e pico de memória."""
+    fn, modules, _ = STAGES[name]
+    try:
+        for module in modules:
+            importlib.import_module(module)
+        base_rss = _max_rss_mb()
+
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            start = time.perf_counter()
+            fn(workdir, n_rows, seed)
+            seconds = time.perf_counter() - start
+    except Exception as e:
+        queue.put({"status": f"error: {type(e).__name__}: {e}"})
+        return
+
+    peak_rss = _max_rss_mb()
+    queue.put(
+        {
+            "status": "ok",
+            "seconds": round(seconds, 3),
+            "peak_rss_mb": round(peak_rss, 1),
+            "rss_delta_mb": round(peak_rss - base_rss, 1),
+        }
+    )
+
+
+def run_stage(name: str, workdir: Path, n_rows: int, seed: int, timeout=None) -> dict:
+    """
+    Roda a etapa em um subprocesso (spawn), para que o pico de RSS seja só dela
+    e para que um OOM kill vire um resultado em vez de derrubar o benchmark.
+    """
+    ctx = mp.get_context("spawn")
+    queue = ctx.Queue()
+    proc = ctx.Process(target=_run_stage, args=(name, workdir, n_rows, seed, queue))
+    proc.start()
+    proc.join(timeout)
+
+    if proc.is_alive():
+        proc.terminate()
+        proc.join()
+        return {"status": f"timeout ({timeout}s)"}
+    if proc.exitcode < 0:
+        # ex.: SIGKILL (-9) do OOM killer
+        return {"status": f"killed (signal {-proc.exitcode})"}
+    if proc.exitcode != 0:
+        return {"status": f"crashed (exitcode {proc.exitcode})"}
+    return queue.get()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Mede tempo e memória de cada etapa do pipeline com dados sintéticos"
+    )
+    parser.add_argument(
+        "--sizes", type=lambda s: int(float(s)), nargs="+", default=SIZES
+    )
+    parser.add_argument("--stages", nargs="+", choices=list(STAGES), default=list(STAGES))
+    parser.add_argument("--timeout", type=float, default=None, help="segundos por etapa")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workdir", type=Path, default=None)
+    parser.add_argument("--output", type=Path, default=RESULTS_PATH)
+    parser.add_argument("--keep-data", action="store_true")
+    args = parser.parse_args(argv)
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with args.output.open("w", newline="") as f:
+        csv.writer(f).writerow(RESULT_COLUMNS)
+
+    # inclui as etapas de geração das quais as escolhidas dependem
+    selected = set(args.stages)
+    for name in args.stages:
+        while STAGES[name][2] is not None:
+            name = STAGES[name][2]
+            selected.add(name)
+    stages = [name for name in STAGES if name in selected]
+
+    # etapas que já falharam não são repetidas em tamanhos maiores
+    broken = set()
+    for n_rows in sorted(args.sizes):
+        workdir = Path(tempfile.mkdtemp(prefix=f"bench_{n_rows}_", dir=args.workdir))
+        failed = set()
+
+        for name in stages:
+            depends_on = STAGES[name][2]
+            if name in broken:
+                result = {"status": "skipped (falhou em tamanho menor)"}
+            elif depends_on in failed:
+                result = {"status": f"skipped ({depends_on} falhou)"}
+            else:
+                result = run_stage(name, workdir, n_rows, args.seed, args.timeout)
+
+            if result["status"] != "ok":
+                failed.add(name)
+                if not result["status"].startswith("skipped"):
+                    broken.add(name)
+
+            row = {"rows": n_rows, "stage": name, **result}
+            print(
+                f"{n_rows:>12,} {name:<14} {row.get('seconds', '-'):>10} s "
+                f"{row.get('peak_rss_mb', '-'):>10} MB  {row['status']}"
+            )
+            with args.output.open("a", newline="") as f:
+                csv.DictWriter(f, RESULT_COLUMNS).writerow(row)
+
+        if args.keep_data:
+            print("Dados mantidos em:", workdir)
+        else:
+            shutil.rmtree(workdir, ignore_errors=True)
+
+    print("Resultados salvos em:", args.output)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,16 +7,16 @@ DATA_DIR = Path(__file__).resolve().parents[1] / "data" / "processed"
 TRAIN_PATH = DATA_DIR / "train.csv"
 TEST_PATH = DATA_DIR / "test.csv"
 REPORTS_DIR = Path(__file__).resolve().parents[1] / "reports"
-REPORTS_DIR.mkdir(exist_ok=True)
 
-def main():
-    ref = pd.read_csv(TRAIN_PATH)
-    cur = pd.read_csv(TEST_PATH)
+def main(train_path=TRAIN_PATH, test_path=TEST_PATH, reports_dir=REPORTS_DIR):
+    ref = pd.read_csv(train_path)
+    cur = pd.read_csv(test_path)
 
     report = Report(metrics=[DataDriftPreset()])
     report.run(reference_data=ref, current_data=cur)
 
-    html_path = REPORTS_DIR / "data_drift_report.html"
+    reports_dir.mkdir(parents=True, exist_ok=True)
+    html_path = reports_dir / "data_drift_report.html"
     report.save_html(html_path)
     print("Relatório de drift salvo em:", html_path)
 
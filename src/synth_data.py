@@ -0,0 +1,215 @@
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+DATA_DIR = Path(__file__).resolve().parents[1] / "data"
+RAW_PATH = DATA_DIR / "raw" / "fish.csv"
+SYNTH_DIR = DATA_DIR / "synthetic"
+
+MEASURE_COLUMNS = ["Weight", "Length1", "Length2", "Length3", "Height", "Width"]
+LOG_COLUMNS = [
+    "timestamp",
+    "source",
+    "tank_id",
+    "predicted_weight_g",
+    "quantity",
+    "biomass_kg",
+]
+# casas decimais usadas no fish.csv original
+DECIMALS = {
+    "Weight": 1,
+    "Length1": 1,
+    "Length2": 1,
+    "Length3": 1,
+    "Height": 4,
+    "Width": 4,
+}
+CHUNK_SIZE = 1_000_000
+
+
+def fit_species_distributions(df: pd.DataFrame) -> dict:
+    """
+    Ajusta, por espécie, uma normal multivariada no log das medidas
+    (peso e comprimentos são aproximadamente log-normais e bem correlacionados).
+    Retorna {espécie: {"prior", "mean", "chol"}}.
+    """
+    # descarta linhas com medida <= 0 (ex.: Roach com peso 0), inválidas no log
+    df = df[(df[MEASURE_COLUMNS] > 0).all(axis=1)]
+    total = len(df)
+
+    dists = {}
+    for species, group in df.groupby("Species"):
+        logs = np.log(group[MEASURE_COLUMNS].to_numpy(dtype=float))
+        cov = np.cov(logs, rowvar=False)
+        # espécies com poucas linhas geram covariância singular
+        cov += np.eye(len(MEASURE_COLUMNS)) * 1e-6
+        dists[species] = {
+            "prior": len(group) / total,
+            "mean": logs.mean(axis=0),
+            "chol": np.linalg.cholesky(cov),
+        }
+    return dists
+
+
+def _sample_species(dists: dict, species: str, n_rows: int, rng) -> np.ndarray:
+    """Amostra n_rows linhas (peso + medidas) de uma espécie."""
+    dist = dists[species]
+    z = rng.standard_normal((n_rows, len(MEASURE_COLUMNS)))
+    values = np.exp(z @ dist["chol"].T + dist["mean"])
+    # mantém Length1 <= Length2 <= Length3, como nos dados reais
+    values[:, 1:4].sort(axis=1)
+    return values
+
+
+def generate_measurements(dists: dict, n_rows: int, rng) -> pd.DataFrame:
+    """Gera n_rows linhas no mesmo formato de data/raw/fish.csv."""
+    species = list(dists)
+    counts = rng.multinomial(n_rows, [dists[s]["prior"] for s in species])
+
+    values = np.concatenate(
+        [_sample_species(dists, s, c, rng) for s, c in zip(species, counts)]
+    )
+    df = pd.DataFrame(values, columns=MEASURE_COLUMNS)
+    for col, decimals in DECIMALS.items():
+        df[col] = df[col].round(decimals)
+    df.insert(0, "Species", np.repeat(species, counts))
+
+    # embaralha para não deixar as espécies agrupadas
+    return df.iloc[rng.permutation(n_rows)].reset_index(drop=True)
+
+
+def assign_tank_species(dists: dict, n_tanks: int, rng) -> np.ndarray:
+    """Sorteia uma espécie por tanque (cada tanque é um lote de uma espécie)."""
+    species = list(dists)
+    priors = [dists[s]["prior"] for s in species]
+    return rng.choice(species, size=n_tanks, p=priors)
+
+
+def generate_prediction_log(
+    dists: dict,
+    tank_species: np.ndarray,
+    n_rows: int,
+    start: pd.Timestamp,
+    end: pd.Timestamp,
+    rng,
+    manual_ratio: float = 0.1,
+) -> pd.DataFrame:
+    """
+    Gera n_rows linhas no formato de data/log_predictions.csv, com timestamps
+    ordenados em [start, end) e peso previsto amostrado da espécie do tanque.
+    """
+    span_us = (end - start) // pd.Timedelta(microseconds=1)
+    offsets = np.sort(rng.integers(0, span_us, size=n_rows))
+    timestamps = start + pd.to_timedelta(offsets, unit="us")
+
+    is_manual = rng.random(n_rows) < manual_ratio
+    tank_idx = rng.integers(0, len(tank_species), size=n_rows)
+    row_species = tank_species[tank_idx]
+
+    weights = np.empty(n_rows)
+    for species in np.unique(row_species):
+        mask = row_species == species
+        weights[mask] = _sample_species(dists, species, int(mask.sum()), rng)[:, 0]
+
+    # imagem: lote com vários peixes; manual: um peixe por medição
+    quantity = np.where(is_manual, 1, rng.integers(1, 501, size=n_rows))
+    tank_id = np.char.add("tank_", (tank_idx + 1).astype(str))
+
+    return pd.DataFrame(
+        {
+            "timestamp": timestamps,
+            "source": np.where(is_manual, "manual", "image"),
+            "tank_id": np.where(is_manual, "manual_tank", tank_id),
+            "predicted_weight_g": weights,
+            "quantity": quantity,
+            "biomass_kg": weights * quantity / 1000.0,
+        },
+        columns=LOG_COLUMNS,
+    )
+
+
+def write_measurements(
+    path: Path, dists: dict, n_rows: int, seed: int = 42, chunk_size: int = CHUNK_SIZE
+) -> None:
+    """Grava n_rows medidas sintéticas em CSV, em blocos para limitar a memória."""
+    rng = np.random.default_rng(seed)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    for i, first in enumerate(range(0, n_rows, chunk_size)):
+        chunk = generate_measurements(dists, min(chunk_size, n_rows - first), rng)
+        chunk.to_csv(path, mode="w" if i == 0 else "a", header=i == 0, index=False)
+
+
+def write_prediction_log(
+    path: Path,
+    dists: dict,
+    n_rows: int,
+    n_tanks: int = 50,
+    n_months: int = 12,
+    start: str = "2025-01-01",
+    seed: int = 42,
+    chunk_size: int = CHUNK_SIZE,
+) -> None:
+    """
+    Grava n_rows previsões sintéticas em CSV. Cada bloco cobre uma fatia
+    consecutiva do período, então o arquivo sai ordenado por timestamp.
+    """
+    rng = np.random.default_rng(seed)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    tank_species = assign_tank_species(dists, n_tanks, rng)
+    t0 = pd.Timestamp(start)
+    period = pd.DateOffset(months=n_months)
+    total = (t0 + period) - t0
+
+    for i, first in enumerate(range(0, n_rows, chunk_size)):
+        size = min(chunk_size, n_rows - first)
+        chunk_start = t0 + total * (first / n_rows)
+        chunk_end = t0 + total * ((first + size) / n_rows)
+        chunk = generate_prediction_log(
+            dists, tank_species, size, chunk_start, chunk_end, rng
+        )
+        # mesmo formato do datetime.isoformat() usado pela API; bem mais rápido
+        # que date_format= no to_csv
+        chunk["timestamp"] = np.datetime_as_string(
+            chunk["timestamp"].to_numpy(), unit="us"
+        )
+        chunk.to_csv(path, mode="w" if i == 0 else "a", header=i == 0, index=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Gera medidas e logs de previsão sintéticos a partir do fish.csv"
+    )
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--log-rows", type=int, default=1_000_000)
+    parser.add_argument("--tanks", type=int, default=50)
+    parser.add_argument("--months", type=int, default=12)
+    parser.add_argument("--start", default="2025-01-01")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--out-dir", type=Path, default=SYNTH_DIR)
+    args = parser.parse_args(argv)
+
+    dists = fit_species_distributions(pd.read_csv(RAW_PATH))
+
+    fish_path = args.out_dir / "fish.csv"
+    write_measurements(fish_path, dists, args.rows, seed=args.seed)
+    print("Medidas sintéticas salvas em:", fish_path)
+
+    log_path = args.out_dir / "log_predictions.csv"
+    write_prediction_log(
+        log_path,
+        dists,
+        args.log_rows,
+        n_tanks=args.tanks,
+        n_months=args.months,
+        start=args.start,
+        seed=args.seed,
+    )
+    print("Logs de previsão sintéticos salvos em:", log_path)
+
+
+if __name__ == "__main__":
+    main()
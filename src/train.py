@@ -12,8 +12,8 @@ DATA_DIR = Path(__file__).resolve().parents[1] / "data"
 TRAIN_PATH = DATA_DIR / "processed" / "train.csv"
 MODELS_DIR = Path(__file__).resolve().parents[1] / "models"
 
-def main():
-    df = pd.read_csv(TRAIN_PATH)
+def main(train_path=TRAIN_PATH, models_dir=MODELS_DIR):
+    df = pd.read_csv(train_path)
 
     X = df[["Length1", "Length2", "Length3", "Height", "Width"]]
     y = df["Weight"]
@@ -42,8 +42,8 @@ def main():
         mlflow.log_param("random_state", 42)
 
         # salva modelo no disco (como antes)
-        MODELS_DIR.mkdir(parents=True, exist_ok=True)
-        model_path = MODELS_DIR / "linear_regression_fish.joblib"
+        models_dir.mkdir(parents=True, exist_ok=True)
+        model_path = models_dir / "linear_regression_fish.joblib"
         dump(model, model_path)
         print("Modelo salvo em:", model_path)
 
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+
+from src.synth_data import (
+    LOG_COLUMNS,
+    MEASURE_COLUMNS,
+    RAW_PATH,
+    assign_tank_species,
+    fit_species_distributions,
+    generate_measurements,
+    write_prediction_log,
+)
+
+
+def _dists():
+    return fit_species_distributions(pd.read_csv(RAW_PATH))
+
+
+def test_generate_measurements_schema():
+    df = generate_measurements(_dists(), 5000, np.random.default_rng(0))
+    assert df.columns.tolist() == ["Species"] + MEASURE_COLUMNS
+    assert len(df) == 5000
+    assert (df[MEASURE_COLUMNS] > 0).all().all()
+    assert (df["Length1"] <= df["Length2"]).all()
+    assert (df["Length2"] <= df["Length3"]).all()
+
+
+def test_generate_measurements_matches_species_means():
+    raw = pd.read_csv(RAW_PATH)
+    df = generate_measurements(_dists(), 200_000, np.random.default_rng(0))
+
+    real = raw.groupby("Species")["Length3"].mean()
+    synth = df.groupby("Species")["Length3"].mean()
+    assert set(synth.index) == set(real.index)
+    assert ((synth - real).abs() / real < 0.1).all()
+
+
+def test_write_prediction_log_sorted_in_chunks(tmp_path):
+    path = tmp_path / "log.csv"
+    write_prediction_log(path, _dists(), 2500, n_tanks=5, n_months=3, chunk_size=1000)
+
+    df = pd.read_csv(path, parse_dates=["timestamp"])
+    assert df.columns.tolist() == LOG_COLUMNS
+    assert len(df) == 2500
+    assert df["timestamp"].is_monotonic_increasing
+    assert df["timestamp"].min() >= pd.Timestamp("2025-01-01")
+    assert df["timestamp"].max() < pd.Timestamp("2025-04-01")
+    assert set(df["tank_id"]) <= {f"tank_{i}" for i in range(1, 6)} | {"manual_tank"}
+    assert np.allclose(
+        df["biomass_kg"], df["predicted_weight_g"] * df["quantity"] / 1000.0
+    )
+
+
+def test_assign_tank_species_uses_known_species():
+    dists = _dists()
+    tanks = assign_tank_species(dists, 20, np.random.default_rng(0))
+    assert len(tanks) == 20
+    assert set(tanks) <= set(dists)